@@ -1,33 +1,39 @@
 from kubernetes import config, client
+from kubernetes.config import ConfigException
 from homeassistant.core import HomeAssistant
 import os
 import logging
+from types import SimpleNamespace
+from urllib3.util.retry import Retry
 
 DOMAIN = "kubeassistant"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connections kept per cluster in the shared urllib3 pool, enough for one
+# watch plus one concurrent list call per resource kind
+CONNECTION_POOL_MAXSIZE = 20
+# Retry transient connection failures instead of failing the whole update
+CONNECTION_RETRIES = Retry(total=3, backoff_factor=0.3)
+
 async def async_setup_entry(hass: HomeAssistant, entry):
     """Set up KubeAssistant from a config entry."""
     kubeconfig_path = entry.data["kubeconfig_stored_path"]
+
+    if not kubeconfig_path or not await hass.async_add_executor_job(os.path.exists, kubeconfig_path):
+        _LOGGER.error(f"Kubeconfig file not found at: {kubeconfig_path}")
+        return False
     
     try:
-        # Load the kubeconfig and create API clients in executor to avoid blocking
-        def _setup_kubernetes_clients():
-            """Set up Kubernetes clients (runs in executor to avoid blocking calls)."""
-            config.load_kube_config(config_file=kubeconfig_path)
-            return {
-                "v1": client.CoreV1Api(),
-                "apps_v1": client.AppsV1Api(),
-                "batch_v1": client.BatchV1Api(),
-                "networking_v1": client.NetworkingV1Api(),
-            }
-
         # Execute the Kubernetes client setup in an executor
-        api_clients = await hass.async_add_executor_job(_setup_kubernetes_clients)
+        api_clients = await hass.async_add_executor_job(_create_api_clients, kubeconfig_path)
+
+        if not api_clients:
+            _LOGGER.error("Failed to create Kubernetes API clients")
+            return False
 
         # Store API clients for use in sensors
-        hass.data[DOMAIN] = api_clients
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = api_clients
 
         # Set up the sensor platform
         await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
@@ -46,15 +52,47 @@ async def async_unload_entry(hass, entry):
     
     if unload_ok:
         # Clean up stored data
-        hass.data.pop(DOMAIN, None)
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
         
         # Optionally remove the stored kubeconfig file
+        # Removing a single small file is near-instant, so it is not worth an executor job
         kubeconfig_path = entry.data.get("kubeconfig_stored_path")
-        if kubeconfig_path and os.path.exists(kubeconfig_path):
+        if kubeconfig_path:
             try:
-                await hass.async_add_executor_job(os.remove, kubeconfig_path)
+                os.remove(kubeconfig_path)
                 _LOGGER.info(f"Removed kubeconfig file: {kubeconfig_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 _LOGGER.warning(f"Failed to remove kubeconfig file: {kubeconfig_path}, error: {e}")
     
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+def _create_api_clients(kubeconfig_path):
+    """Create Kubernetes API clients with specific kubeconfig.
+
+    All clients share a single ApiClient, and with it a single connection pool,
+    so that every call for this cluster reuses the same HTTPS connections.
+    """
+    try:
+        # Load configuration from the specific kubeconfig file
+        configuration = client.Configuration()
+        config.load_kube_config(config_file=kubeconfig_path, client_configuration=configuration)
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        configuration.retries = CONNECTION_RETRIES
+        api_client = client.ApiClient(configuration)
+
+        # Create API clients; connectivity is verified by the first resource fetch
+        return SimpleNamespace(
+            v1=client.CoreV1Api(api_client),
+            apps_v1=client.AppsV1Api(api_client),
+            batch_v1=client.BatchV1Api(api_client),
+            networking_v1=client.NetworkingV1Api(api_client),
+        )
+
+    except ConfigException as e:
+        _LOGGER.error(f"Kubernetes config error: {e}")
+        return None
+    except Exception as e:
+        _LOGGER.error(f"Failed to create Kubernetes API clients: {e}")
+        return None
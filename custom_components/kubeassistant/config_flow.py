@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 from pathlib import Path
@@ -13,6 +14,12 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Prefer the libyaml based loader, it is several times faster than the pure Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 DOMAIN = "kubeassistant"
 
 class KubeAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -79,13 +86,20 @@ async def save_uploaded_kubeconfig_file(hass: HomeAssistant, uploaded_file_id: s
 
     def _process_upload() -> str:
         with process_uploaded_file(hass, uploaded_file_id) as file_path:
-            # Read the file content for validation
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Validate that it's a valid kubeconfig
+            # Validate that it's a valid kubeconfig. YAML is parsed straight from the
+            # file handle in chunks; the JSON fast path reads the whole file at once
             try:
-                config_data = yaml.safe_load(content)
+                with open(file_path, 'rb') as f:
+                    config_data = None
+                    if f.peek(1).lstrip()[:1] == b'{':
+                        try:
+                            # Kubeconfigs exported with `kubectl config view -o json` are plain JSON,
+                            # which parses much faster than going through the YAML parser
+                            config_data = json.load(f)
+                        except ValueError:
+                            f.seek(0)
+                    if config_data is None:
+                        config_data = yaml.load(f, Loader=_YamlLoader)
                 
                 # Basic validation - check for required kubeconfig fields
                 if not isinstance(config_data, dict):
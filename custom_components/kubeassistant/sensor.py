@@ -1,126 +1,88 @@
-import os
+import asyncio
+import functools
 import logging
-from kubernetes import client, config
-from kubernetes.config import ConfigException
-from homeassistant.helpers.entity import Entity
-from homeassistant.const import EntityCategory
-import tempfile
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Callable
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EntityCategory
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 DOMAIN = "kubeassistant"
+# Maximum number of objects returned per list request
+LIST_PAGE_SIZE = 500
+# Seconds a single watch request stays open before it is reopened
+WATCH_TIMEOUT = 60
+# Seconds to wait before reconnecting after a failed watch
+WATCH_RETRY_DELAY = 30
+# Seconds between re-lists of a kind the credentials are not allowed to watch
+POLL_INTERVAL = 30
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the sensor from a config entry."""
-    # Get the stored kubeconfig path from config entry
-    kubeconfig_path = entry.data.get("kubeconfig_stored_path")
-    
-    if not kubeconfig_path or not os.path.exists(kubeconfig_path):
-        _LOGGER.error(f"Kubeconfig file not found at: {kubeconfig_path}")
-        return False
-    
-    # Test kubeconfig file and create API clients
-    try:
-        # Create API clients with the specific kubeconfig
-        api_clients = await hass.async_add_executor_job(
-            _create_api_clients, kubeconfig_path
-        )
-        
-        if not api_clients:
-            _LOGGER.error("Failed to create Kubernetes API clients")
-            return False
-            
-        v1, apps_v1, batch_v1, networking_v1 = api_clients
-        
-    except Exception as e:
-        _LOGGER.error(f"Failed to initialize Kubernetes API clients: {e}")
-        return False
+    # API clients are created once per config entry and shared by all sensors
+    api_clients = hass.data[DOMAIN][entry.entry_id]
 
-    # Fetch all resources to create sensors
-    try:
-        resources = await hass.async_add_executor_job(
-            _fetch_all_resources, v1, apps_v1, batch_v1, networking_v1
-        )
-        
-        if not resources:
-            _LOGGER.error("Failed to fetch Kubernetes resources")
-            return False
-            
-    except Exception as e:
-        _LOGGER.error(f"Failed to fetch Kubernetes resources: {e}")
+    # Fetch all resources once through the coordinator to create sensors
+    coordinator = KubeCoordinator(hass, api_clients)
+    await coordinator.async_refresh()
+
+    if not coordinator.last_update_success:
+        _LOGGER.error("Failed to fetch Kubernetes resources")
         return False
 
-    sensors = []
-    deployments, statefulsets, daemonsets, namespaces, nodes, cronjobs = resources
-
-    # Create sensors for each resource type
-    for dep in deployments:
-        sensors.append(KubeDeploymentSensor(dep, kubeconfig_path, entry.entry_id))
-    for sts in statefulsets:
-        sensors.append(KubeStatefulSetSensor(sts, kubeconfig_path, entry.entry_id))
-    for ds in daemonsets:
-        sensors.append(KubeDaemonSetSensor(ds, kubeconfig_path, entry.entry_id))
-    for ns in namespaces:
-        sensors.append(KubeNamespaceSensor(ns, kubeconfig_path, entry.entry_id))
-    for node in nodes:
-        sensors.append(KubeNodeSensor(node, kubeconfig_path, entry.entry_id))
-    for cj in cronjobs:
-        sensors.append(KubeCronJobSensor(cj, kubeconfig_path, entry.entry_id))
+    # Create a sensor for every resource of every kind
+    sensors = [
+        KubeResourceSensor(coordinator, kind, resource, entry.entry_id)
+        for kind in KIND_SPECS
+        for resource in coordinator.data[kind].values()
+    ]
 
     async_add_entities(sensors)
+    coordinator.async_start_watches(entry)
     _LOGGER.info(f"Successfully created {len(sensors)} Kubernetes sensors")
     return True
 
-async def async_unload_entry(hass, entry):
-    """Unload a config entry."""
-    # Clean up stored data
-    if entry.entry_id in hass.data.get("kubeassistant", {}):
-        hass.data["kubeassistant"].pop(entry.entry_id)
-    return True
-
-def _create_api_clients(kubeconfig_path):
-    """Create Kubernetes API clients with specific kubeconfig."""
-    try:
-        # Load configuration from the specific kubeconfig file
-        config.load_kube_config(config_file=kubeconfig_path)
-        
-        # Create API clients
-        v1 = client.CoreV1Api()
-        apps_v1 = client.AppsV1Api()
-        batch_v1 = client.BatchV1Api()
-        networking_v1 = client.NetworkingV1Api()
-        
-        # Test the connection with a simple API call
-        # Use the correct method name for testing connectivity
-        v1.list_namespace(limit=1)
-        
-        return (v1, apps_v1, batch_v1, networking_v1)
-        
-    except ConfigException as e:
-        _LOGGER.error(f"Kubernetes config error: {e}")
-        return None
-    except Exception as e:
-        _LOGGER.error(f"Failed to create Kubernetes API clients: {e}")
-        return None
-
-def _fetch_all_resources(v1, apps_v1, batch_v1, networking_v1):
-    """Fetch all Kubernetes resources."""
-    try:
-        deployments = apps_v1.list_deployment_for_all_namespaces()
-        statefulsets = apps_v1.list_stateful_set_for_all_namespaces()
-        daemonsets = apps_v1.list_daemon_set_for_all_namespaces()
-        namespaces = v1.list_namespace()
-        nodes = v1.list_node()
-        cronjobs = batch_v1.list_cron_job_for_all_namespaces()
-        
-        return (
-            deployments.items, statefulsets.items, daemonsets.items,
-            namespaces.items, nodes.items, cronjobs.items
-        )
-        
-    except Exception as e:
-        _LOGGER.error(f"Failed to fetch resources: {e}")
-        return None
-
+def _paginate(list_fn):
+    """Yield every page of a list call, following the continue token."""
+    token = None
+    while True:
+        response = list_fn(limit=LIST_PAGE_SIZE, _continue=token, _preload_content=False)
+        page = json_loads(response.data)
+        yield page
+        token = page["metadata"].get("continue")
+        if not token:
+            break
+
+def _list_resources(list_fn):
+    """List one resource kind, keyed by UID, along with the list resourceVersion.
+
+    Large clusters are listed page by page so that only one page of the
+    response has to be decoded at a time. Responses are decoded into plain
+    dicts, skipping the kubernetes client's model deserialization.
+    """
+    resources = {}
+    resource_version = None
+    for page in _paginate(list_fn):
+        resources.update((r["metadata"]["uid"], r) for r in page["items"])
+        resource_version = page["metadata"]["resourceVersion"]
+    return resources, resource_version
+
+# Bytes per Kubernetes binary memory suffix, plain numbers are in bytes
+_MEMORY_UNITS = {"Ki": 1024, "Mi": 1024**2, "Gi": 1024**3, "Ti": 1024**4, "": 1}
+_GIB = 1 << 30
+
+@functools.lru_cache(maxsize=256)
 def _convert_memory_to_gb(memory_str):
     """Convert Kubernetes memory string to GB.
     
@@ -128,430 +90,513 @@ def _convert_memory_to_gb(memory_str):
     - 5368504Ki (Kibibytes)
     - 5242880Mi (Mebibytes)  
     - 5120Gi (Gibibytes)
+    - 5Ti (Tebibytes)
     - 5368709120 (bytes)
+
+    Node capacities rarely change, so results are cached per input string.
     """
     if not memory_str:
         return None
         
     memory_str = str(memory_str).strip()
+    suffix = memory_str[-2:] if memory_str[-2:] in _MEMORY_UNITS else ""
     
     try:
-        if memory_str.endswith('Ki'):
-            # Kibibytes to GiB: 1 Ki = 1024 bytes; 1 GiB = 1,073,741,824 bytes
-            kibibytes = float(memory_str[:-2])
-            giB = (kibibytes * 1024) / 1_073_741_824
-            return round(giB)
-        elif memory_str.endswith('Mi'):
-            # Mebibytes to GiB: 1 Mi = 1024^2 bytes
-            mebibytes = float(memory_str[:-2])
-            giB = (mebibytes * 1024 * 1024) / 1_073_741_824
-            return round(giB)
-        elif memory_str.endswith('Gi'):
-            # Gibibytes to GiB: 1 Gi = 1024^3 bytes
-            gibibytes = float(memory_str[:-2])
-            giB = (gibibytes * 1024 * 1024 * 1024) / 1_073_741_824
-            return round(giB)
-        else:
-            # Assume bytes
-            bytes_val = float(memory_str)
-            giB = bytes_val / 1_073_741_824
-            return round(giB)
+        number = float(memory_str[:-2] if suffix else memory_str)
+        return round(number * _MEMORY_UNITS[suffix] / _GIB)
     except (ValueError, TypeError):
         _LOGGER.warning(f"Failed to convert memory value: {memory_str}")
         return None
 
-# --- Base Sensor Class ---
+def _parse_timestamp(timestamp):
+    """Parse an RFC 3339 timestamp from a raw API response into a datetime."""
+    return dt_util.parse_datetime(timestamp) if timestamp else None
+
+# --- Resource Kinds ---
+
+# Condition and address values compared while building state and attributes
+_CONDITION_TRUE = "True"
+_CONDITION_FALSE = "False"
+_CONDITION_READY = "Ready"
+_CONDITION_AVAILABLE = "Available"
+_CONDITION_PROGRESSING = "Progressing"
+_ADDRESS_INTERNAL_IP = "InternalIP"
 
-class KubeResourceSensor(Entity):
-    """Base class for Kubernetes resource sensors."""
+def _deployment_state(resource):
+    status = resource.get("status", {})
+
+    # Determine deployment status based on conditions and replicas
+    for condition in status.get("conditions") or []:
+        if condition["type"] == _CONDITION_PROGRESSING and condition["status"] == _CONDITION_FALSE:
+            return "Failed"
+        elif condition["type"] == _CONDITION_AVAILABLE and condition["status"] == _CONDITION_FALSE:
+            return "Progressing"
     
-    def __init__(self, resource, kubeconfig_path, entry_id):
-        self._resource = resource
-        self._kubeconfig_path = kubeconfig_path
-        self._entry_id = entry_id
-        self._available = True
-        self._api_clients = None
+    # Check if deployment is ready
+    desired_replicas = status.get("replicas") or 0
+    available_replicas = status.get("availableReplicas") or 0
     
-    @property
-    def available(self):
-        """Return if entity is available."""
-        return self._available
+    if desired_replicas == 0:
+        return "Stopped"
+    elif available_replicas == desired_replicas:
+        return "Running"
+    else:
+        return "Progressing"
+
+def _deployment_attrs(resource):
+    status = resource.get("status", {})
+    return {
+        "namespace": resource["metadata"]["namespace"],
+        "replicas": status.get("replicas"),
+        "updated_replicas": status.get("updatedReplicas"),
+        "unavailable_replicas": status.get("unavailableReplicas"),
+    }
+
+def _statefulset_state(resource):
+    status = resource.get("status", {})
+
+    # Determine StatefulSet status based on replicas
+    desired_replicas = status.get("replicas") or 0
+    ready_replicas = status.get("readyReplicas") or 0
+    current_replicas = status.get("currentReplicas") or 0
+    updated_replicas = status.get("updatedReplicas") or 0
     
-    @property
-    def entity_category(self):
-        """Return the entity category."""
-        return EntityCategory.DIAGNOSTIC
+    if desired_replicas == 0:
+        return "Stopped"
+    elif ready_replicas == desired_replicas and updated_replicas == desired_replicas:
+        return "Running"
+    elif current_replicas > 0:
+        return "Progressing"
+    else:
+        return "Failed"
+
+def _statefulset_attrs(resource):
+    status = resource.get("status", {})
+    return {
+        "namespace": resource["metadata"]["namespace"],
+        "replicas": status.get("replicas"),
+        "ready_replicas": status.get("readyReplicas"),
+        "current_replicas": status.get("currentReplicas"),
+        "updated_replicas": status.get("updatedReplicas"),
+    }
+
+def _daemonset_state(resource):
+    status = resource.get("status", {})
+
+    # Determine DaemonSet status based on desired vs ready
+    desired_scheduled = status.get("desiredNumberScheduled") or 0
+    number_ready = status.get("numberReady") or 0
+    number_available = status.get("numberAvailable") or 0
     
-    @property
-    def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
+    if desired_scheduled == 0:
+        return "Stopped"
+    elif number_ready == desired_scheduled and number_available == desired_scheduled:
+        return "Running"
+    elif number_ready > 0:
+        return "Progressing"
+    else:
+        return "Failed"
+
+def _daemonset_attrs(resource):
+    status = resource.get("status", {})
+    return {
+        "namespace": resource["metadata"]["namespace"],
+        "desired_number_scheduled": status.get("desiredNumberScheduled"),
+        "current_number_scheduled": status.get("currentNumberScheduled"),
+        "number_ready": status.get("numberReady"),
+        "number_available": status.get("numberAvailable"),
+    }
+
+def _namespace_state(resource):
+    return resource.get("status", {}).get("phase")
+
+def _namespace_attrs(resource):
+    metadata = resource["metadata"]
+    return {
+        "labels": metadata.get("labels"),
+        "creation_timestamp": str(_parse_timestamp(metadata.get("creationTimestamp"))),
+        "status": resource.get("status", {}).get("phase"),
+    }
+
+def _node_state(resource):
+    return "Ready" if any(
+        c["type"] == _CONDITION_READY and c["status"] == _CONDITION_TRUE
+        for c in resource.get("status", {}).get("conditions") or []
+    ) else "NotReady"
+
+def _node_attrs(resource):
+    status = resource.get("status", {})
+    addresses = status.get("addresses") or []
+    conditions = status.get("conditions") or []
+    capacity = status.get("capacity")
+    allocatable = status.get("allocatable")
+
+    # Extract IP address from node addresses
+    ip_address = None
+    if addresses:
+        for addr in addresses:
+            if addr["type"] == _ADDRESS_INTERNAL_IP:
+                ip_address = addr["address"]
+                break
+        # Fallback to first address if no InternalIP found
+        if not ip_address:
+            ip_address = addresses[0]["address"]
     
-    def _get_api_clients(self):
-        """Get fresh API clients for this sensor."""
-        if not self._api_clients:
-            self._api_clients = _create_api_clients(self._kubeconfig_path)
-        return self._api_clients
+    # Extract CPU and Memory from capacity and allocatable
+    cpu_capacity = capacity.get("cpu") if capacity else None
+    memory_capacity_raw = capacity.get("memory") if capacity else None
+    memory_allocatable_raw = allocatable.get("memory") if allocatable else None
     
-    async def _safe_api_call(self, api_type, func_name, *args):
-        """Safely call Kubernetes API with error handling."""
-        try:
-            clients = await self.hass.async_add_executor_job(self._get_api_clients)
-            if not clients:
-                self._available = False
-                return None
-                
-            v1, apps_v1, batch_v1, networking_v1 = clients
-            
-            # Select the appropriate API client
-            api_map = {
-                'v1': v1,
-                'apps_v1': apps_v1,
-                'batch_v1': batch_v1,
-                'networking_v1': networking_v1
-            }
-            
-            api = api_map.get(api_type)
-            if not api:
-                _LOGGER.error(f"Unknown API type: {api_type}")
-                return None
-                
-            func = getattr(api, func_name)
-            result = await self.hass.async_add_executor_job(func, *args)
-            self._available = True
-            return result
-            
-        except Exception as e:
-            _LOGGER.warning(f"Failed to update {self.name}: {e}")
-            self._available = False
-            # Reset API clients on error to force recreation
-            self._api_clients = None
-            return None
-
-# --- Sensor Classes ---
-
-class KubeDeploymentSensor(KubeResourceSensor):
-    def __init__(self, dep, kubeconfig_path, entry_id):
-        super().__init__(dep, kubeconfig_path, entry_id)
-        self._dep = dep
-
-    @property
-    def name(self):
-        return f"Deployment {self._dep.metadata.namespace}/{self._dep.metadata.name}"
-
-    @property
-    def unique_id(self):
-        return f"k8s_deployment_{self._dep.metadata.uid}"
-
-    @property
-    def state(self):
-        # Determine deployment status based on conditions and replicas
-        if self._dep.status.conditions:
-            for condition in self._dep.status.conditions:
-                if condition.type == "Progressing" and condition.status == "False":
-                    return "Failed"
-                elif condition.type == "Available" and condition.status == "False":
-                    return "Progressing"
-        
-        # Check if deployment is ready
-        desired_replicas = self._dep.status.replicas or 0
-        available_replicas = self._dep.status.available_replicas or 0
-        
-        if desired_replicas == 0:
-            return "Stopped"
-        elif available_replicas == desired_replicas:
-            return "Running"
-        else:
-            return "Progressing"
-
-    @property
-    def unit_of_measurement(self):
-        return None
-
-    @property
-    def icon(self):
-        return "mdi:application-brackets"
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "namespace": self._dep.metadata.namespace,
-            "replicas": self._dep.status.replicas,
-            "updated_replicas": self._dep.status.updated_replicas,
-            "unavailable_replicas": self._dep.status.unavailable_replicas,
-            "resource_type": "Deployment",
-        }
+    # Convert memory values to GB
+    memory_capacity_gb = _convert_memory_to_gb(memory_capacity_raw)
+    memory_allocatable_gb = _convert_memory_to_gb(memory_allocatable_raw)
+    
+    return {
+        "ip_address": ip_address,
+        "CPU Cores": f"{cpu_capacity} cores",
+        "Total Memory (GB)": f"{memory_capacity_gb} GB",
+        "Free Memory (GB)": f"{memory_allocatable_gb} GB",
+        "labels": resource["metadata"].get("labels"),
+        "addresses": [a["address"] for a in addresses],
+        "capacity": capacity,
+        "allocatable": allocatable,
+        "conditions": [{"type": c["type"], "status": c["status"]} for c in conditions],
+    }
+
+def _cronjob_state(resource):
+    last_schedule_time = resource.get("status", {}).get("lastScheduleTime")
+    return str(_parse_timestamp(last_schedule_time)) if last_schedule_time else "Never"
+
+def _cronjob_attrs(resource):
+    spec = resource["spec"]
+    return {
+        "namespace": resource["metadata"]["namespace"],
+        "schedule": spec.get("schedule"),
+        "suspend": spec.get("suspend"),
+        "active": [a["name"] for a in resource.get("status", {}).get("active") or []],
+    }
+
+@dataclass(frozen=True)
+class KindSpec:
+    """Describe how a Kubernetes resource kind is listed and shown as a sensor."""
+
+    resource_type: str
+    icon: str
+    api: str
+    list_fn_name: str
+    namespaced: bool
+    state_fn: Callable
+    attrs_fn: Callable
+
+KIND_SPECS = {
+    "deployments": KindSpec(
+        resource_type="Deployment",
+        icon="mdi:application-brackets",
+        api="apps_v1",
+        list_fn_name="list_deployment_for_all_namespaces",
+        namespaced=True,
+        state_fn=_deployment_state,
+        attrs_fn=_deployment_attrs,
+    ),
+    "statefulsets": KindSpec(
+        resource_type="StatefulSet",
+        icon="mdi:application-brackets",
+        api="apps_v1",
+        list_fn_name="list_stateful_set_for_all_namespaces",
+        namespaced=True,
+        state_fn=_statefulset_state,
+        attrs_fn=_statefulset_attrs,
+    ),
+    "daemonsets": KindSpec(
+        resource_type="DaemonSet",
+        icon="mdi:application-brackets",
+        api="apps_v1",
+        list_fn_name="list_daemon_set_for_all_namespaces",
+        namespaced=True,
+        state_fn=_daemonset_state,
+        attrs_fn=_daemonset_attrs,
+    ),
+    "namespaces": KindSpec(
+        resource_type="Namespace",
+        icon="mdi:folder-outline",
+        api="v1",
+        list_fn_name="list_namespace",
+        namespaced=False,
+        state_fn=_namespace_state,
+        attrs_fn=_namespace_attrs,
+    ),
+    "nodes": KindSpec(
+        resource_type="Node",
+        icon="mdi:server",
+        api="v1",
+        list_fn_name="list_node",
+        namespaced=False,
+        state_fn=_node_state,
+        attrs_fn=_node_attrs,
+    ),
+    "cronjobs": KindSpec(
+        resource_type="CronJob",
+        icon="mdi:clock-outline",
+        api="batch_v1",
+        list_fn_name="list_cron_job_for_all_namespaces",
+        namespaced=True,
+        state_fn=_cronjob_state,
+        attrs_fn=_cronjob_attrs,
+    ),
+}
+
+# --- Coordinator ---
+
+class KubeCoordinator(DataUpdateCoordinator):
+    """Keep all Kubernetes resources up to date through one watch per resource kind.
+
+    The initial refresh lists every kind once; afterwards a background watch per
+    kind pushes only the changed objects into the coordinator data.
+    """
 
-    async def async_update(self):
-        dep = await self._safe_api_call(
-            "apps_v1",
-            "read_namespaced_deployment",
-            self._dep.metadata.name,
-            self._dep.metadata.namespace,
+    def __init__(self, hass, api_clients):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
         )
-        if dep:
-            self._dep = dep
-
-class KubeStatefulSetSensor(KubeResourceSensor):
-    def __init__(self, sts, kubeconfig_path, entry_id):
-        super().__init__(sts, kubeconfig_path, entry_id)
-        self._sts = sts
-
-    @property
-    def name(self):
-        return f"StatefulSet {self._sts.metadata.namespace}/{self._sts.metadata.name}"
-
-    @property
-    def unique_id(self):
-        return f"k8s_statefulset_{self._sts.metadata.uid}"
-
-    @property
-    def state(self):
-        # Determine StatefulSet status based on replicas
-        desired_replicas = self._sts.status.replicas or 0
-        ready_replicas = self._sts.status.ready_replicas or 0
-        current_replicas = self._sts.status.current_replicas or 0
-        updated_replicas = self._sts.status.updated_replicas or 0
-        
-        if desired_replicas == 0:
-            return "Stopped"
-        elif ready_replicas == desired_replicas and updated_replicas == desired_replicas:
-            return "Running"
-        elif current_replicas > 0:
-            return "Progressing"
-        else:
-            return "Failed"
-
-    @property
-    def unit_of_measurement(self):
-        return None
-
-    @property
-    def icon(self):
-        return "mdi:application-brackets"
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "namespace": self._sts.metadata.namespace,
-            "replicas": self._sts.status.replicas,
-            "ready_replicas": self._sts.status.ready_replicas,
-            "current_replicas": self._sts.status.current_replicas,
-            "updated_replicas": self._sts.status.updated_replicas,
-            "resource_type": "StatefulSet",
+        self._list_fns = {
+            kind: getattr(getattr(api_clients, spec.api), spec.list_fn_name)
+            for kind, spec in KIND_SPECS.items()
         }
-
-    async def async_update(self):
-        sts = await self._safe_api_call(
-            "apps_v1",
-            "read_namespaced_stateful_set",
-            self._sts.metadata.name,
-            self._sts.metadata.namespace,
+        self._resource_versions = {}
+        self._watches = {}
+        self._streams = {}
+        self._stopping = False
+        self._failed_kinds = set()
+        self._polled_kinds = set()
+
+    async def _async_update_data(self):
+        """Fetch the latest state of every resource from the API server."""
+        # The list calls are network bound, so every kind is listed in its own
+        # executor job and the total latency is that of the slowest call
+        try:
+            results = await asyncio.gather(*(
+                self.hass.async_add_executor_job(_list_resources, list_fn)
+                for list_fn in self._list_fns.values()
+            ))
+        except Exception as e:
+            raise UpdateFailed(f"Failed to fetch resources: {e}") from e
+
+        data = {}
+        for kind, (items, resource_version) in zip(self._list_fns, results):
+            data[kind] = items
+            self._resource_versions[kind] = resource_version
+        return data
+
+    @callback
+    def async_start_watches(self, entry):
+        """Start a background watch for every resource kind."""
+        for kind in self._list_fns:
+            entry.async_create_background_task(
+                self.hass, self._async_watch(kind), f"{DOMAIN}_watch_{kind}"
+            )
+        entry.async_on_unload(self._async_stop_watches)
+        entry.async_on_unload(
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop_watches)
         )
-        if sts:
-            self._sts = sts
-
-class KubeNamespaceSensor(KubeResourceSensor):
-    def __init__(self, ns, kubeconfig_path, entry_id):
-        super().__init__(ns, kubeconfig_path, entry_id)
-        self._ns = ns
-
-    @property
-    def name(self):
-        return f"Namespace {self._ns.metadata.name}"
-
-    @property
-    def unique_id(self):
-        return f"k8s_namespace_{self._ns.metadata.uid}"
 
-    @property
-    def state(self):
-        return self._ns.status.phase
-
-    @property
-    def icon(self):
-        return "mdi:folder-outline"
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "labels": self._ns.metadata.labels,
-            "creation_timestamp": str(self._ns.metadata.creation_timestamp),
-            "status": self._ns.status.phase,
-            "resource_type": "Namespace",
-        }
-
-    async def async_update(self):
-        ns = await self._safe_api_call(
-            "v1",
-            "read_namespace",
-            self._ns.metadata.name,
+    @callback
+    def _async_stop_watches(self, event=None):
+        """Stop all running watches and release their executor threads."""
+        self._stopping = True
+        for w in self._watches.values():
+            w.stop()
+        for stream in list(self._streams.values()):
+            # Unblock the executor thread reading an idle stream. Without
+            # socket shutdown support (urllib3 < 2.3) the watch ends at the
+            # next event or after WATCH_TIMEOUT.
+            try:
+                stream.shutdown()
+            except Exception as e:
+                _LOGGER.debug(f"Could not shut down watch stream: {e}")
+
+    def kind_available(self, kind):
+        """Return False while the data for one resource kind cannot be refreshed."""
+        return kind not in self._failed_kinds
+
+    async def _async_watch(self, kind):
+        """Watch one resource kind, re-listing when the resourceVersion expires.
+
+        Failures only affect sensors of this kind. When the credentials are not
+        allowed to watch the kind, it is re-listed every POLL_INTERVAL instead.
+        """
+        while not self._stopping:
+            if self._resource_versions.get(kind) is None:
+                try:
+                    await self._async_relist(kind)
+                except Exception as e:
+                    self._async_set_kind_failed(kind, e)
+                    await asyncio.sleep(WATCH_RETRY_DELAY)
+                    continue
+
+            if kind in self._polled_kinds:
+                await asyncio.sleep(POLL_INTERVAL)
+                self._resource_versions[kind] = None
+                continue
+
+            try:
+                await self.hass.async_add_executor_job(self._watch, kind)
+            except Exception as e:
+                # Start over from a fresh list, events may have been missed
+                self._resource_versions[kind] = None
+                if isinstance(e, ApiException) and e.status == HTTPStatus.GONE:
+                    _LOGGER.debug(f"Watch for {kind} expired, re-listing")
+                    continue
+                if isinstance(e, ApiException) and e.status == HTTPStatus.FORBIDDEN:
+                    _LOGGER.warning(
+                        f"Not allowed to watch {kind}, polling every {POLL_INTERVAL} seconds instead. "
+                        "Grant the 'watch' verb to receive live updates"
+                    )
+                    self._polled_kinds.add(kind)
+                    continue
+                self._async_set_kind_failed(kind, e)
+                await asyncio.sleep(WATCH_RETRY_DELAY)
+
+    async def _async_relist(self, kind):
+        """Replace the data of one resource kind with a fresh list."""
+        items, resource_version = await self.hass.async_add_executor_job(
+            _list_resources, self._list_fns[kind]
         )
-        if ns:
-            self._ns = ns
-
-class KubeNodeSensor(KubeResourceSensor):
-    def __init__(self, node, kubeconfig_path, entry_id):
-        super().__init__(node, kubeconfig_path, entry_id)
-        self._node = node
-
-    @property
-    def name(self):
-        return f"Node {self._node.metadata.name}"
-
-    @property
-    def unique_id(self):
-        return f"k8s_node_{self._node.metadata.uid}"
-
-    @property
-    def state(self):
-        return "Ready" if any(
-            c.type == "Ready" and c.status == "True" for c in self._node.status.conditions
-        ) else "NotReady"
-
-    @property
-    def icon(self):
-        return "mdi:server"
-
-    @property
-    def extra_state_attributes(self):
-        # Extract IP address from node addresses
-        ip_address = None
-        if self._node.status.addresses:
-            for addr in self._node.status.addresses:
-                if addr.type == "InternalIP":
-                    ip_address = addr.address
+        self._resource_versions[kind] = resource_version
+        self.data[kind] = items
+        if kind in self._failed_kinds:
+            _LOGGER.info(f"Updates for {kind} recovered")
+            self._failed_kinds.discard(kind)
+        self.async_update_listeners()
+
+    @callback
+    def _async_set_kind_failed(self, kind, err):
+        """Mark the sensors of one resource kind unavailable."""
+        if kind in self._failed_kinds:
+            _LOGGER.debug(f"Updates for {kind} still failing: {err}")
+            return
+        _LOGGER.warning(f"Updates for {kind} failed: {err}")
+        self._failed_kinds.add(kind)
+        self.async_update_listeners()
+
+    def _watch(self, kind):
+        """Stream changes for one resource kind until the watch times out.
+
+        Runs in the executor; every event is handed to the event loop.
+        """
+        if self._stopping:
+            return
+        list_fn = self._list_fns[kind]
+
+        def open_stream(**kwargs):
+            # Keep the streaming response so _async_stop_watches can shut it down
+            stream = list_fn(**kwargs)
+            self._streams[kind] = stream
+            return stream
+
+        # The "object" return type hands back plain dicts instead of client models
+        w = watch.Watch(return_type="object")
+        self._watches[kind] = w
+        try:
+            for event in w.stream(
+                open_stream,
+                resource_version=self._resource_versions[kind],
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT,
+            ):
+                resource = event["raw_object"]
+                self._resource_versions[kind] = resource["metadata"]["resourceVersion"]
+                if event["type"] == "BOOKMARK":
+                    continue
+
+                self.hass.loop.call_soon_threadsafe(
+                    self._async_handle_event, kind, event["type"], resource
+                )
+                if self._stopping:
                     break
-            # Fallback to first address if no InternalIP found
-            if not ip_address and self._node.status.addresses:
-                ip_address = self._node.status.addresses[0].address
-        
-        # Extract CPU and Memory from capacity and allocatable
-        cpu_capacity = self._node.status.capacity.get("cpu") if self._node.status.capacity else None
-        memory_capacity_raw = self._node.status.capacity.get("memory") if self._node.status.capacity else None
-        memory_allocatable_raw = self._node.status.allocatable.get("memory") if self._node.status.allocatable else None
-        
-        # Convert memory values to GB
-        memory_capacity_gb = _convert_memory_to_gb(memory_capacity_raw)
-        memory_allocatable_gb = _convert_memory_to_gb(memory_allocatable_raw)
-        
-        return {
-            "ip_address": ip_address,
-            "CPU Cores": f"{cpu_capacity} cores",
-            "Total Memory (GB)": f"{memory_capacity_gb} GB",
-            "Free Memory (GB)": f"{memory_allocatable_gb} GB",
-            "labels": self._node.metadata.labels,
-            "addresses": [a.address for a in self._node.status.addresses] if self._node.status.addresses else [],
-            "capacity": self._node.status.capacity,
-            "allocatable": self._node.status.allocatable,
-            "conditions": [{"type": c.type, "status": c.status} for c in self._node.status.conditions] if self._node.status.conditions else [],
-            "resource_type": "Node",
-        }
+        except Exception:
+            # A stream shut down while stopping is expected, not a failure
+            if not self._stopping:
+                raise
+        finally:
+            self._streams.pop(kind, None)
+
+    @callback
+    def _async_handle_event(self, kind, event_type, resource):
+        """Apply a single watch event to the coordinator data."""
+        resources = self.data[kind]
+        if event_type == "DELETED":
+            resources.pop(resource["metadata"]["uid"], None)
+        else:
+            resources[resource["metadata"]["uid"]] = resource
+        self.async_update_listeners()
 
-    async def async_update(self):
-        node = await self._safe_api_call(
-            "v1",
-            "read_node",
-            self._node.metadata.name,
-        )
-        if node:
-            self._node = node
+# --- Sensor Class ---
 
-class KubeDaemonSetSensor(KubeResourceSensor):
-    def __init__(self, ds, kubeconfig_path, entry_id):
-        super().__init__(ds, kubeconfig_path, entry_id)
-        self._ds = ds
+class KubeResourceSensor(CoordinatorEntity, SensorEntity):
+    """Sensor for a single Kubernetes resource, driven by its KindSpec."""
 
-    @property
-    def name(self):
-        return f"DaemonSet {self._ds.metadata.namespace}/{self._ds.metadata.name}"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
 
-    @property
-    def unique_id(self):
-        return f"k8s_daemonset_{self._ds.metadata.uid}"
+    def __init__(self, coordinator, kind, resource, entry_id):
+        super().__init__(coordinator)
+        self._kind = kind
+        self._spec = KIND_SPECS[kind]
+        self._resource = resource
+        self._uid = resource["metadata"]["uid"]
+        self._entry_id = entry_id
+        self._cache_rv = None
+        self._last_available = None
 
-    @property
-    def state(self):
-        # Determine DaemonSet status based on desired vs ready
-        desired_scheduled = self._ds.status.desired_number_scheduled or 0
-        number_ready = self._ds.status.number_ready or 0
-        number_available = self._ds.status.number_available or 0
-        
-        if desired_scheduled == 0:
-            return "Stopped"
-        elif number_ready == desired_scheduled and number_available == desired_scheduled:
-            return "Running"
-        elif number_ready > 0:
-            return "Progressing"
+        metadata = resource["metadata"]
+        if self._spec.namespaced:
+            self._attr_name = f"{self._spec.resource_type} {metadata['namespace']}/{metadata['name']}"
         else:
-            return "Failed"
-
-    @property
-    def unit_of_measurement(self):
-        return None
-
-    @property
-    def icon(self):
-        return "mdi:application-brackets"
+            self._attr_name = f"{self._spec.resource_type} {metadata['name']}"
+        self._attr_unique_id = f"k8s_{self._spec.resource_type.lower()}_{self._uid}"
+        self._attr_icon = self._spec.icon
+        self._update_from_resource()
 
     @property
-    def extra_state_attributes(self):
-        return {
-            "namespace": self._ds.metadata.namespace,
-            "desired_number_scheduled": self._ds.status.desired_number_scheduled,
-            "current_number_scheduled": self._ds.status.current_number_scheduled,
-            "number_ready": self._ds.status.number_ready,
-            "number_available": self._ds.status.number_available,
-            "resource_type": "DaemonSet",
-        }
-
-    async def async_update(self):
-        ds = await self._safe_api_call(
-            "apps_v1",
-            "read_namespaced_daemon_set",
-            self._ds.metadata.name,
-            self._ds.metadata.namespace,
+    def available(self):
+        """Return if entity is available."""
+        return (
+            super().available
+            and self.coordinator.kind_available(self._kind)
+            and self._uid in self.coordinator.data[self._kind]
         )
-        if ds:
-            self._ds = ds
-
-class KubeCronJobSensor(KubeResourceSensor):
-    def __init__(self, cj, kubeconfig_path, entry_id):
-        super().__init__(cj, kubeconfig_path, entry_id)
-        self._cj = cj
-
-    @property
-    def name(self):
-        return f"CronJob {self._cj.metadata.namespace}/{self._cj.metadata.name}"
-
-    @property
-    def unique_id(self):
-        return f"k8s_cronjob_{self._cj.metadata.uid}"
 
-    @property
-    def state(self):
-        return str(self._cj.status.last_schedule_time) if self._cj.status.last_schedule_time else "Never"
-
-    @property
-    def icon(self):
-        return "mdi:clock-outline"
-
-    @property
-    def extra_state_attributes(self):
-        return {
-            "namespace": self._cj.metadata.namespace,
-            "schedule": self._cj.spec.schedule,
-            "suspend": self._cj.spec.suspend,
-            "active": [a.name for a in self._cj.status.active] if self._cj.status.active else [],
-            "resource_type": "CronJob",
-        }
-
-    async def async_update(self):
-        cj = await self._safe_api_call(
-            "batch_v1",
-            "read_namespaced_cron_job",
-            self._cj.metadata.name,
-            self._cj.metadata.namespace,
-        )
-        if cj:
-            self._cj = cj
\ No newline at end of file
+    def _update_from_resource(self):
+        """Recompute the native value and attributes when the resource has changed."""
+        resource_version = self._resource["metadata"]["resourceVersion"]
+        if resource_version != self._cache_rv:
+            self._attr_native_value = self._spec.state_fn(self._resource)
+            self._attr_extra_state_attributes = {
+                **self._spec.attrs_fn(self._resource),
+                "resource_type": self._spec.resource_type,
+            }
+            self._cache_rv = resource_version
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Pick this sensor's resource out of the coordinator data.
+
+        Every watch event notifies all sensors, so only write state when this
+        sensor's resource or availability actually changed.
+        """
+        resource = self.coordinator.data[self._kind].get(self._uid)
+        if resource is not None:
+            self._resource = resource
+
+        available = self.available
+        if (
+            available == self._last_available
+            and self._resource["metadata"]["resourceVersion"] == self._cache_rv
+        ):
+            return
+
+        self._last_available = available
+        self._update_from_resource()
+        super()._handle_coordinator_update()